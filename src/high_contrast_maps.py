@@ -13,9 +13,10 @@ import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
 import geopandas as gpd
+import shapely
 from matplotlib.gridspec import GridSpec
 from pathlib import Path
-import warnings
+import functools
 
 # Paths relative to project root
 PROJECT_ROOT = Path(__file__).parent.parent
@@ -36,9 +37,45 @@ BLUE_DARK = '#084594'   # No Effective ID
 GREY_DARK = '#4a4a4a'
 GREY_LIGHT = '#d9d9d9'
 
+# FIPS codes for the 50 states + DC (zero-padded strings, as in Census shapefiles).
+# Filtering with this set avoids casting the STATEFP column to int on every load.
+STATE_FIPS = frozenset(f'{i:02d}' for i in range(1, 57))
 
+# Benefit columns that feed the has_benefits indicator
+BENEFIT_COLS = ['health_children', 'health_adults', 'health_seniors', 'food', 'eitc']
+
+
+def _save_png(fig, output_path, tight=True):
+    """Save a 300-DPI PNG through Pillow with light zlib compression.
+
+    compress_level=1 cuts most of the libpng-default encode time for
+    these large maps in exchange for a modestly bigger file.
+    """
+    fig.savefig(output_path, dpi=300, facecolor='white',
+                bbox_inches='tight' if tight else None,
+                pil_kwargs={'compress_level': 1})
+
+
+def _has_benefits(policies):
+    """1 if the state offers any tracked benefit to illegal immigrants.
+
+    One any(axis=1) reduction over the benefit columns, replacing the chain
+    of five == comparisons OR'd together that each caller used to build.
+    Runs on the raw ndarray and returns int8: the reduction skips the
+    per-column pandas machinery and the result is as narrow as a 0/1 flag
+    needs to be.
+    """
+    return (policies[BENEFIT_COLS].to_numpy() == 1).any(axis=1).astype(np.int8)
+
+
+@functools.lru_cache(maxsize=1)
 def set_style():
-    """Set consistent style matching main branch."""
+    """Set consistent style matching main branch.
+
+    Cached like visualize.set_style: every figure function calls this, but
+    parsing the mplstyle file and rewriting rcParams only needs to happen
+    once per process.
+    """
     plt.style.use('seaborn-v0_8-whitegrid')
     plt.rcParams.update({
         'font.family': 'sans-serif',
@@ -52,8 +89,34 @@ def set_style():
     })
 
 
+# Albers equal-area CRS used for all map layouts
+ALBERS_CRS = 'ESRI:102003'
+
+# On-disk caches for the Census boundary layers. Every map function calls a
+# loader, and without these each call re-downloads and re-parses the zipped
+# shapefile; GeoParquet reloads in milliseconds.
+_STATE_GEO_CACHE = DATA_DIR / 'us_states_5m.parquet'
+_COUNTY_GEO_CACHE = DATA_DIR / 'us_counties_20m.parquet'
+
+
+@functools.lru_cache(maxsize=1)
 def load_state_geodata():
-    """Load state boundaries from Census Bureau shapefile (simplified 5m boundaries)."""
+    """Load state boundaries from Census Bureau shapefile (simplified 5m boundaries).
+
+    Process-cached on top of the on-disk parquet cache: the map functions
+    each call this once and immediately merge (which returns a new frame),
+    so sharing the loaded layer across them is safe.
+    """
+    if _STATE_GEO_CACHE.exists():
+        try:
+            # _ensure_albers covers caches written before projection moved
+            # into the loader; current caches are stored projected.
+            gdf = _ensure_albers(gpd.read_parquet(_STATE_GEO_CACHE))
+            gdf['state_po'] = gdf['state_po'].astype('category')
+            return gdf
+        except Exception:
+            pass  # stale or unreadable cache; fall through to a fresh load
+
     us_states_url = "https://www2.census.gov/geo/tiger/GENZ2021/shp/cb_2021_us_state_5m.zip"
     try:
         gdf = gpd.read_file(us_states_url)
@@ -65,14 +128,35 @@ def load_state_geodata():
         else:
             raise FileNotFoundError(f"Could not download Census data and no local file at {geo_path}: {e}")
 
-    # Filter to 50 states + DC
-    gdf = gdf[gdf['STATEFP'].astype(int) <= 56]
+    # Filter to 50 states + DC, and project once here so consumers don't
+    # each pay for the same Albers transform.
+    gdf = gdf[gdf['STATEFP'].isin(STATE_FIPS)]
     gdf = gdf.rename(columns={'STUSPS': 'state_po'})
+    gdf['state_po'] = gdf['state_po'].astype('category')
+    gdf = gdf.to_crs(ALBERS_CRS)
+
+    try:
+        gdf.to_parquet(_STATE_GEO_CACHE)
+    except Exception:
+        pass  # e.g. pyarrow not installed; caching is best-effort
+
     return gdf
 
 
+def _ensure_albers(gdf):
+    """Reproject to the Albers layout CRS only if not already there."""
+    if gdf.crs != ALBERS_CRS:
+        return gdf.to_crs(ALBERS_CRS)
+    return gdf
+
+
+@functools.lru_cache(maxsize=4)
 def load_electoral_data(year=None):
-    """Load electoral data and return latest year results."""
+    """Load electoral data and return latest year results.
+
+    Cached per requested year so the panel CSV is parsed once, not once per
+    figure; callers merge the returned frame rather than mutating it.
+    """
     panel = pd.read_csv(DATA_DIR / 'panel_presidential_did.csv')
     if 'state' in panel.columns and 'state_po' not in panel.columns:
         panel = panel.rename(columns={'state': 'state_po'})
@@ -81,11 +165,38 @@ def load_electoral_data(year=None):
         year = panel['year'].max()
 
     latest = panel[panel['year'] == year].groupby('state_po')['dem_share'].mean().reset_index()
+    latest['state_po'] = latest['state_po'].astype('category')
+    # Derive the winner flag once here; every figure needs it and the merge
+    # carries it along, so no caller has to recompute it from dem_share.
+    latest['dem_won'] = (latest['dem_share'] >= 50).astype(int)
     return latest, year
 
 
+@functools.lru_cache(maxsize=1)
+def _load_policies():
+    """Load the state policy table once, keyed by a categorical state_po.
+
+    The categorical join key lets the repeated state-level merges compare
+    integer category codes instead of hashing strings, and the cache means
+    the CSV is parsed once per process. Callers merge or filter the
+    returned frame rather than mutating it.
+    """
+    policies = pd.read_csv(DATA_DIR / 'state_policies.csv')
+    if 'abbrev' in policies.columns:
+        policies = policies.rename(columns={'abbrev': 'state_po'})
+    policies['has_benefits'] = _has_benefits(policies)
+    policies['state_po'] = policies['state_po'].astype('category')
+    return policies
+
+
 def load_county_geodata():
     """Load county boundaries from Census Bureau shapefile (20m resolution)."""
+    if _COUNTY_GEO_CACHE.exists():
+        try:
+            return gpd.read_parquet(_COUNTY_GEO_CACHE)
+        except Exception:
+            pass
+
     us_counties_url = "https://www2.census.gov/geo/tiger/GENZ2021/shp/cb_2021_us_county_20m.zip"
     try:
         gdf = gpd.read_file(us_counties_url)
@@ -105,6 +216,11 @@ def load_county_geodata():
     exclude = ['AK', 'HI', 'PR', 'VI', 'GU', 'AS', 'MP']
     gdf = gdf[~gdf['STUSPS'].isin(exclude)]
 
+    try:
+        gdf.to_parquet(_COUNTY_GEO_CACHE)
+    except Exception:
+        pass
+
     return gdf
 
 
@@ -157,10 +273,10 @@ def _build_voter_id_border_pairs() -> tuple:
     adjacency = pd.read_csv(adjacency_path)
 
     # Load state_policies.csv for 2-tier voter ID classification
-    policies = pd.read_csv(DATA_DIR / 'state_policies.csv')
+    policies = _load_policies()
 
     # 2-tier classification: ID Required = id_strictness <= 3
-    id_required_states = set(policies[policies['id_strictness'] <= 3]['abbrev'])
+    id_required_states = set(policies.loc[policies['id_strictness'] <= 3, 'state_po'])
 
     # Add state abbreviations
     adjacency['county_fips'] = adjacency['county_fips'].astype(str).str.zfill(5)
@@ -203,7 +319,6 @@ def create_border_counties_map(policy='welfare', output_path=None, year=2024):
     For voter_id: builds borders from Census adjacency data (independent of welfare)
     """
     set_style()
-    warnings.filterwarnings('ignore')
 
     fig, ax = plt.subplots(1, 1, figsize=(16, 10))
 
@@ -211,7 +326,7 @@ def create_border_counties_map(policy='welfare', output_path=None, year=2024):
         counties = load_county_geodata()
         states = load_state_geodata()
         county_votes = load_county_votes()
-        policies = pd.read_csv(DATA_DIR / 'state_policies.csv')
+        policies = _load_policies()
 
         # Get voting data for the specified year (or closest available)
         available_years = county_votes['year'].unique()
@@ -230,13 +345,7 @@ def create_border_counties_map(policy='welfare', output_path=None, year=2024):
             border_fips = set(border_links['benefit_county_fips'].astype(str).str.zfill(5)) | \
                          set(border_links['nonbenefit_county_fips'].astype(str).str.zfill(5))
             # Welfare benefit states
-            treat_states = set(policies[
-                (policies['health_children'] == 1) |
-                (policies['health_adults'] == 1) |
-                (policies['health_seniors'] == 1) |
-                (policies['food'] == 1) |
-                (policies['eitc'] == 1)
-            ]['abbrev'])
+            treat_states = set(policies.loc[policies['has_benefits'] == 1, 'state_po'])
 
         # Merge with geometry
         counties = counties.merge(votes, on='fips', how='left')
@@ -263,8 +372,8 @@ def create_border_counties_map(policy='welfare', output_path=None, year=2024):
         counties['color'] = counties['category'].map(colors)
 
         # Project to Albers for continental US
-        counties = counties.to_crs('ESRI:102003')
-        states = states.to_crs('ESRI:102003')
+        counties = counties.to_crs(ALBERS_CRS)
+        states = _ensure_albers(states)
 
         # Plot counties
         counties.plot(ax=ax, color=counties['color'], edgecolor='white', linewidth=0.1)
@@ -315,42 +424,58 @@ def create_border_counties_map(policy='welfare', output_path=None, year=2024):
     plt.tight_layout()
 
     if output_path:
-        fig.savefig(output_path, dpi=300, bbox_inches='tight', facecolor='white')
+        _save_png(fig, output_path)
         plt.close(fig)
         print(f"  Saved: {output_path}")
 
     return fig
 
 
+# Candidate pairs by election year; other years fall back to generic labels
+_CANDIDATES = {
+    2024: ('Harris', 'Trump'),
+    2020: ('Biden', 'Trump'),
+    2016: ('Clinton', 'Trump'),
+}
+
+
+@functools.lru_cache(maxsize=8)
 def get_candidate_labels(year):
     """Get candidate labels based on election year."""
-    dem = 'Harris' if year == 2024 else 'Biden' if year == 2020 else 'Clinton' if year == 2016 else 'Dem'
-    rep = 'Trump' if year >= 2016 else 'Rep'
-    return dem, rep
+    return _CANDIDATES.get(year, ('Dem', 'Trump' if year >= 2016 else 'Rep'))
 
 
-def plot_state_map(ax, continental, alaska, hawaii, color_col, title, legend_elements):
-    """Plot a single state map with Alaska/Hawaii insets, plotting each state individually."""
-    # Plot each continental state one-by-one to avoid color artifacts
-    for idx, row in continental.iterrows():
-        color = row[color_col]
-        continental[continental.index == idx].plot(
-            ax=ax, color=color, edgecolor='white', linewidth=0.8
-        )
+def _inset_transform(geoms, scale, xoff, yoff):
+    """
+    Uniformly scale about the origin and translate, via shapely 2.0's
+    vectorized transform: one ufunc pass over the packed coordinate buffer
+    instead of an affinity call per geometry.
+    """
+    return shapely.transform(geoms.values, lambda coords: coords * scale + (xoff, yoff))
 
+
+def plot_state_map(ax, continental, alaska, hawaii, color_col, title, legend_elements):
+    """Plot a single state map with Alaska/Hawaii insets."""
+    # One vectorized plot call for all continental states; passing the color
+    # column as a sequence keeps per-state colors exact without the boolean
+    # index + plot round trip per state. rasterized keeps the polygon fills
+    # as a raster layer in vector exports while titles/legends stay vector.
+    continental.plot(ax=ax, color=continental[color_col], edgecolor='white', linewidth=0.8,
+                     rasterized=True)
+
+    # Inset placement (same parameters visualize.py uses), applied as one
+    # vectorized coordinate pass per inset. Only the geometry is needed for
+    # plotting, so the transformed GeoSeries is drawn directly instead of
+    # copying the whole frame to swap its geometry column.
     if not alaska.empty:
-        alaska_scaled = alaska.copy()
-        alaska_scaled.geometry = alaska_scaled.geometry.scale(0.35, 0.35, origin=(0, 0))
-        alaska_scaled.geometry = alaska_scaled.geometry.translate(-1800000, -1400000)
-        color = alaska[color_col].values[0]
-        alaska_scaled.plot(ax=ax, color=color, edgecolor='white', linewidth=0.8)
+        alaska_inset = gpd.GeoSeries(_inset_transform(alaska.geometry, 0.35, -1800000, -1400000))
+        alaska_inset.plot(ax=ax, color=alaska[color_col].values[0],
+                          edgecolor='white', linewidth=0.8, rasterized=True)
 
     if not hawaii.empty:
-        hawaii_scaled = hawaii.copy()
-        hawaii_scaled.geometry = hawaii_scaled.geometry.scale(1.0, 1.0, origin=(0, 0))
-        hawaii_scaled.geometry = hawaii_scaled.geometry.translate(5200000, -1200000)
-        color = hawaii[color_col].values[0]
-        hawaii_scaled.plot(ax=ax, color=color, edgecolor='white', linewidth=0.8)
+        hawaii_inset = gpd.GeoSeries(_inset_transform(hawaii.geometry, 1.0, 5200000, -1200000))
+        hawaii_inset.plot(ax=ax, color=hawaii[color_col].values[0],
+                          edgecolor='white', linewidth=0.8, rasterized=True)
 
     ax.set_title(title, fontsize=16, fontweight='bold', pad=10)
     ax.axis('off')
@@ -396,60 +521,48 @@ def create_three_panel_map(
     - indicator_colors: optional (color_for_1, color_for_0) tuple for custom colors
     """
     set_style()
-    warnings.filterwarnings('ignore')
 
     dem_candidate, rep_candidate = get_candidate_labels(year)
 
-    # Ensure dem_won exists
     states_gdf = states_gdf.copy()
-    states_gdf['dem_won'] = (states_gdf['dem_share'] >= 50).astype(int)
-
-    # Project to Albers
-    states_gdf = states_gdf.to_crs('ESRI:102003')
-
-    # Separate regions
-    continental = states_gdf[~states_gdf['state_po'].isin(['AK', 'HI', 'PR', 'VI', 'GU', 'AS', 'MP'])].copy()
-    alaska = states_gdf[states_gdf['state_po'] == 'AK'].copy()
-    hawaii = states_gdf[states_gdf['state_po'] == 'HI'].copy()
-
-    # Create color columns
+    # dem_won comes precomputed from load_electoral_data; derive it only
+    # for callers that merged a raw dem_share themselves.
+    if 'dem_won' not in states_gdf.columns:
+        states_gdf['dem_won'] = (states_gdf['dem_share'] >= 50).astype(int)
+
+    # Already Albers when it came through load_state_geodata; guard covers
+    # callers handing in an unprojected layer.
+    states_gdf = _ensure_albers(states_gdf)
+
+    # Create color columns on the full frame before the regional split, so
+    # the AK/HI rows inherit them and no per-region second pass is needed.
+    # All indicators here are binary, so a two-way np.where select on the
+    # underlying array replaces the dict-based Series.map.
     if indicator_colors:
-        indicator_color_map = {1: indicator_colors[0], 0: indicator_colors[1]}
+        color_for_1, color_for_0 = indicator_colors
     elif invert_indicator_colors:
-        indicator_color_map = {1: RED_VIVID, 0: BLUE_VIVID}
+        color_for_1, color_for_0 = RED_VIVID, BLUE_VIVID
     else:
-        indicator_color_map = {1: BLUE_VIVID, 0: RED_VIVID}
-    continental['color_indicator'] = continental[indicator_col].map(indicator_color_map)
-    continental['color_vote'] = continental['dem_won'].map({1: BLUE_VIVID, 0: RED_VIVID})
+        color_for_1, color_for_0 = BLUE_VIVID, RED_VIVID
+    states_gdf['color_indicator'] = np.where(states_gdf[indicator_col] == 1, color_for_1, color_for_0)
+    states_gdf['color_vote'] = np.where(states_gdf['dem_won'] == 1, BLUE_VIVID, RED_VIVID)
 
     if invert_match:
-        continental['match'] = (continental[indicator_col] != continental['dem_won']).astype(int)
+        states_gdf['match'] = (states_gdf[indicator_col] != states_gdf['dem_won']).astype(int)
     else:
-        continental['match'] = (continental[indicator_col] == continental['dem_won']).astype(int)
-    continental['color_match'] = continental['match'].map({1: GREEN_MATCH, 0: ORANGE_MISMATCH})
-
-    # Apply colors to Alaska/Hawaii
-    for region in [alaska, hawaii]:
-        if not region.empty:
-            region['color_indicator'] = region[indicator_col].map(indicator_color_map)
-            region['color_vote'] = region['dem_won'].map({1: BLUE_VIVID, 0: RED_VIVID})
-            if invert_match:
-                region['match'] = (region[indicator_col] != region['dem_won']).astype(int)
-            else:
-                region['match'] = (region[indicator_col] == region['dem_won']).astype(int)
-            region['color_match'] = region['match'].map({1: GREEN_MATCH, 0: ORANGE_MISMATCH})
+        states_gdf['match'] = (states_gdf[indicator_col] == states_gdf['dem_won']).astype(int)
+    states_gdf['color_match'] = np.where(states_gdf['match'] == 1, GREEN_MATCH, ORANGE_MISMATCH)
+
+    # Separate regions
+    continental = states_gdf[~states_gdf['state_po'].isin(['AK', 'HI', 'PR', 'VI', 'GU', 'AS', 'MP'])].copy()
+    alaska = states_gdf[states_gdf['state_po'] == 'AK'].copy()
+    hawaii = states_gdf[states_gdf['state_po'] == 'HI'].copy()
 
-    # Count for labels (using all 51 jurisdictions)
+    # Count for labels (the frame covers all 51 jurisdictions)
     n_true = int(states_gdf[indicator_col].sum())
     n_false = len(states_gdf) - n_true
-    # Calculate match from all states including AK/HI
-    all_matches = continental['match'].sum()
-    for region in [alaska, hawaii]:
-        if not region.empty and 'match' in region.columns:
-            all_matches += region['match'].sum()
-    n_match = int(all_matches)
-    total_states = len(continental) + (1 if not alaska.empty else 0) + (1 if not hawaii.empty else 0)
-    pct_match = 100 * n_match / total_states
+    n_match = int(states_gdf['match'].sum())
+    pct_match = 100 * n_match / len(states_gdf)
 
     # Create figure with tight spacing
     fig = plt.figure(figsize=(14, 9))
@@ -461,15 +574,6 @@ def create_three_panel_map(
     ax_bottom = fig.add_subplot(gs[1, 1:3])
 
     # Top Left: Indicator map
-    if indicator_colors:
-        color_for_1 = indicator_colors[0]
-        color_for_0 = indicator_colors[1]
-    elif invert_indicator_colors:
-        color_for_1 = RED_VIVID
-        color_for_0 = BLUE_VIVID
-    else:
-        color_for_1 = BLUE_VIVID
-        color_for_0 = RED_VIVID
     legend_indicator = [
         mpatches.Patch(facecolor=color_for_1, edgecolor='#333', label=f'{indicator_labels[0]} ({n_true} states)'),
         mpatches.Patch(facecolor=color_for_0, edgecolor='#333', label=f'{indicator_labels[1]} ({n_false} states)'),
@@ -508,7 +612,9 @@ def create_three_panel_map(
     fig.suptitle(figure_title, fontsize=18, fontweight='bold', y=0.98)
 
     if output_path:
-        fig.savefig(output_path, dpi=300, bbox_inches='tight', facecolor='white')
+        # Margins are managed explicitly by the GridSpec above, so the
+        # tight-bbox measuring pass (a full extra render) is skipped.
+        _save_png(fig, output_path, tight=False)
         plt.close(fig)
         print(f"  Saved: {output_path}")
 
@@ -520,9 +626,7 @@ def create_high_contrast_maps(output_path=None, year=None):
     states_gdf = load_state_geodata()
     electoral, year = load_electoral_data(year)
 
-    policies = pd.read_csv(DATA_DIR / 'state_policies.csv')
-    if 'abbrev' in policies.columns:
-        policies = policies.rename(columns={'abbrev': 'state_po'})
+    policies = _load_policies()
 
     states_gdf = states_gdf.merge(policies[['state_po', 'id_strictness']], on='state_po', how='left')
     states_gdf = states_gdf.merge(electoral, on='state_po', how='left')
@@ -548,58 +652,42 @@ def create_high_contrast_maps(output_path=None, year=None):
 def create_high_contrast_maps_2tier(output_path=None, year=None):
     """Create voter ID vs electoral outcomes map using 2-tier color scheme from src/visualize.py."""
     set_style()
-    warnings.filterwarnings('ignore')
 
     states_gdf = load_state_geodata()
     electoral, year = load_electoral_data(year)
 
-    policies = pd.read_csv(DATA_DIR / 'state_policies.csv')
-    if 'abbrev' in policies.columns:
-        policies = policies.rename(columns={'abbrev': 'state_po'})
+    policies = _load_policies()
 
     states_gdf = states_gdf.merge(policies[['state_po', 'id_strictness']], on='state_po', how='left')
     states_gdf = states_gdf.merge(electoral, on='state_po', how='left')
 
     states_gdf['id_strictness'] = states_gdf['id_strictness'].fillna(3)
     states_gdf['has_strict_id'] = (states_gdf['id_strictness'] <= 3).astype(int)
-    states_gdf['dem_won'] = (states_gdf['dem_share'] >= 50).astype(int)
 
     dem_candidate, rep_candidate = get_candidate_labels(year)
 
-    # Project to Albers
-    states_gdf = states_gdf.to_crs('ESRI:102003')
-
-    # Separate regions
-    continental = states_gdf[~states_gdf['state_po'].isin(['AK', 'HI', 'PR', 'VI', 'GU', 'AS', 'MP'])].copy()
-    alaska = states_gdf[states_gdf['state_po'] == 'AK'].copy()
-    hawaii = states_gdf[states_gdf['state_po'] == 'HI'].copy()
+    # Already Albers when it came through load_state_geodata; guard covers
+    # callers handing in an unprojected layer.
+    states_gdf = _ensure_albers(states_gdf)
 
+    # Color/match columns on the full frame before the split (AK/HI inherit)
     # 2-tier colors for voter ID: ID Required = light blue, No ID = dark blue
-    continental['color_indicator'] = continental['has_strict_id'].map({1: BLUE_LIGHT, 0: BLUE_DARK})
+    states_gdf['color_indicator'] = np.where(states_gdf['has_strict_id'] == 1, BLUE_LIGHT, BLUE_DARK)
     # Legacy colors for presidential: Harris = blue, Trump = red
-    continental['color_vote'] = continental['dem_won'].map({1: BLUE_VIVID, 0: RED_VIVID})
-
+    states_gdf['color_vote'] = np.where(states_gdf['dem_won'] == 1, BLUE_VIVID, RED_VIVID)
     # Match: ID Required + Trump won, OR No ID + Harris won
-    continental['match'] = (continental['has_strict_id'] != continental['dem_won']).astype(int)
-    continental['color_match'] = continental['match'].map({1: GREEN_MATCH, 0: ORANGE_MISMATCH})
+    states_gdf['match'] = (states_gdf['has_strict_id'] != states_gdf['dem_won']).astype(int)
+    states_gdf['color_match'] = np.where(states_gdf['match'] == 1, GREEN_MATCH, ORANGE_MISMATCH)
 
-    for region in [alaska, hawaii]:
-        if not region.empty:
-            region['color_indicator'] = region['has_strict_id'].map({1: BLUE_LIGHT, 0: BLUE_DARK})
-            region['color_vote'] = region['dem_won'].map({1: BLUE_VIVID, 0: RED_VIVID})
-            region['match'] = (region['has_strict_id'] != region['dem_won']).astype(int)
-            region['color_match'] = region['match'].map({1: GREEN_MATCH, 0: ORANGE_MISMATCH})
+    # Separate regions
+    continental = states_gdf[~states_gdf['state_po'].isin(['AK', 'HI', 'PR', 'VI', 'GU', 'AS', 'MP'])].copy()
+    alaska = states_gdf[states_gdf['state_po'] == 'AK'].copy()
+    hawaii = states_gdf[states_gdf['state_po'] == 'HI'].copy()
 
     n_id_req = int(states_gdf['has_strict_id'].sum())
     n_no_id = len(states_gdf) - n_id_req
-    # Calculate match from all states including AK/HI
-    all_matches = continental['match'].sum()
-    for region in [alaska, hawaii]:
-        if not region.empty and 'match' in region.columns:
-            all_matches += region['match'].sum()
-    n_match = int(all_matches)
-    total_states = len(continental) + (1 if not alaska.empty else 0) + (1 if not hawaii.empty else 0)
-    pct_match = 100 * n_match / total_states
+    n_match = int(states_gdf['match'].sum())
+    pct_match = 100 * n_match / len(states_gdf)
 
     # Create figure
     fig = plt.figure(figsize=(14, 9))
@@ -649,7 +737,9 @@ def create_high_contrast_maps_2tier(output_path=None, year=None):
     fig.suptitle('Voter ID Laws and Electoral Outcomes', fontsize=18, fontweight='bold', y=0.98)
 
     if output_path:
-        fig.savefig(output_path, dpi=300, bbox_inches='tight', facecolor='white')
+        # Margins are managed explicitly by the GridSpec above, so the
+        # tight-bbox measuring pass (a full extra render) is skipped.
+        _save_png(fig, output_path, tight=False)
         plt.close(fig)
         print(f"  Saved: {output_path}")
 
@@ -659,63 +749,39 @@ def create_high_contrast_maps_2tier(output_path=None, year=None):
 def create_welfare_high_contrast_maps(output_path=None, year=None):
     """Create welfare benefits vs electoral outcomes map using 2-tier color scheme."""
     set_style()
-    warnings.filterwarnings('ignore')
 
     states_gdf = load_state_geodata()
     electoral, year = load_electoral_data(year)
 
-    policies = pd.read_csv(DATA_DIR / 'state_policies.csv')
-    if 'abbrev' in policies.columns:
-        policies = policies.rename(columns={'abbrev': 'state_po'})
-
-    policies['has_benefits'] = (
-        (policies['health_children'] == 1) |
-        (policies['health_adults'] == 1) |
-        (policies['health_seniors'] == 1) |
-        (policies['food'] == 1) |
-        (policies['eitc'] == 1)
-    ).astype(int)
+    policies = _load_policies()
 
     states_gdf = states_gdf.merge(policies[['state_po', 'has_benefits']], on='state_po', how='left')
     states_gdf = states_gdf.merge(electoral, on='state_po', how='left')
     states_gdf['has_benefits'] = states_gdf['has_benefits'].fillna(0).astype(int)
-    states_gdf['dem_won'] = (states_gdf['dem_share'] >= 50).astype(int)
 
     dem_candidate, rep_candidate = get_candidate_labels(year)
 
-    # Project to Albers
-    states_gdf = states_gdf.to_crs('ESRI:102003')
+    # Already Albers when it came through load_state_geodata; guard covers
+    # callers handing in an unprojected layer.
+    states_gdf = _ensure_albers(states_gdf)
+
+    # Color/match columns on the full frame before the split (AK/HI inherit)
+    # 2-tier colors for welfare: Has Benefits = dark blue, No Benefits = light blue
+    states_gdf['color_indicator'] = np.where(states_gdf['has_benefits'] == 1, BLUE_DARK, BLUE_LIGHT)
+    states_gdf['color_vote'] = np.where(states_gdf['dem_won'] == 1, BLUE_VIVID, RED_VIVID)
+    # Match: Benefits + Dem won, OR No Benefits + Rep won
+    states_gdf['match'] = (states_gdf['has_benefits'] == states_gdf['dem_won']).astype(int)
+    states_gdf['color_match'] = np.where(states_gdf['match'] == 1, GREEN_MATCH, ORANGE_MISMATCH)
 
     # Separate regions
     continental = states_gdf[~states_gdf['state_po'].isin(['AK', 'HI', 'PR', 'VI', 'GU', 'AS', 'MP'])].copy()
     alaska = states_gdf[states_gdf['state_po'] == 'AK'].copy()
     hawaii = states_gdf[states_gdf['state_po'] == 'HI'].copy()
 
-    # 2-tier colors for welfare: Has Benefits = dark blue, No Benefits = light blue
-    continental['color_indicator'] = continental['has_benefits'].map({1: BLUE_DARK, 0: BLUE_LIGHT})
-    continental['color_vote'] = continental['dem_won'].map({1: BLUE_VIVID, 0: RED_VIVID})
-
-    # Match: Benefits + Dem won, OR No Benefits + Rep won
-    continental['match'] = (continental['has_benefits'] == continental['dem_won']).astype(int)
-    continental['color_match'] = continental['match'].map({1: GREEN_MATCH, 0: ORANGE_MISMATCH})
-
-    for region in [alaska, hawaii]:
-        if not region.empty:
-            region['color_indicator'] = region['has_benefits'].map({1: BLUE_DARK, 0: BLUE_LIGHT})
-            region['color_vote'] = region['dem_won'].map({1: BLUE_VIVID, 0: RED_VIVID})
-            region['match'] = (region['has_benefits'] == region['dem_won']).astype(int)
-            region['color_match'] = region['match'].map({1: GREEN_MATCH, 0: ORANGE_MISMATCH})
-
     n_benefits = int(states_gdf['has_benefits'].sum())
     n_no_benefits = len(states_gdf) - n_benefits
-    # Calculate match from all states including AK/HI
-    all_matches = continental['match'].sum()
-    for region in [alaska, hawaii]:
-        if not region.empty and 'match' in region.columns:
-            all_matches += region['match'].sum()
-    n_match = int(all_matches)
-    total_states = len(continental) + (1 if not alaska.empty else 0) + (1 if not hawaii.empty else 0)
-    pct_match = 100 * n_match / total_states
+    n_match = int(states_gdf['match'].sum())
+    pct_match = 100 * n_match / len(states_gdf)
 
     # Create figure
     fig = plt.figure(figsize=(14, 9))
@@ -765,7 +831,9 @@ def create_welfare_high_contrast_maps(output_path=None, year=None):
     fig.suptitle('Illegal Immigrant Welfare Benefits and Electoral Outcomes', fontsize=18, fontweight='bold', y=0.98)
 
     if output_path:
-        fig.savefig(output_path, dpi=300, bbox_inches='tight', facecolor='white')
+        # Margins are managed explicitly by the GridSpec above, so the
+        # tight-bbox measuring pass (a full extra render) is skipped.
+        _save_png(fig, output_path, tight=False)
         plt.close(fig)
         print(f"  Saved: {output_path}")
 
@@ -780,12 +848,16 @@ def create_unauthorized_pop_high_contrast_maps(output_path=None, year=None):
     unauthorized_df = pd.read_csv(DATA_DIR / 'unauthorized_immigrant_pop_2023.csv')
     unauthorized_df = unauthorized_df[unauthorized_df['state_abbrev'] != 'US']
     unauthorized_df = unauthorized_df.rename(columns={'state_abbrev': 'state_po'})
+    unauthorized_df['state_po'] = unauthorized_df['state_po'].astype('category')
 
     states_gdf = states_gdf.merge(unauthorized_df[['state_po', 'unauthorized_pop']], on='state_po', how='left')
     states_gdf = states_gdf.merge(electoral, on='state_po', how='left')
 
-    median_pop = states_gdf['unauthorized_pop'].median()
-    states_gdf['high_unauthorized'] = (states_gdf['unauthorized_pop'] >= median_pop).astype(int)
+    # Pull the column out once: nanmedian on the raw array skips the Series
+    # dispatch, and the same array feeds the threshold comparison.
+    pop_vals = states_gdf['unauthorized_pop'].to_numpy()
+    median_pop = np.nanmedian(pop_vals)
+    states_gdf['high_unauthorized'] = (pop_vals >= median_pop).astype(int)
 
     return create_three_panel_map(
         states_gdf,
@@ -806,16 +878,13 @@ def prepare_voter_id_data(year=None):
     states_gdf = load_state_geodata()
     electoral, year = load_electoral_data(year)
 
-    policies = pd.read_csv(DATA_DIR / 'state_policies.csv')
-    if 'abbrev' in policies.columns:
-        policies = policies.rename(columns={'abbrev': 'state_po'})
+    policies = _load_policies()
 
     states_gdf = states_gdf.merge(policies[['state_po', 'id_strictness']], on='state_po', how='left')
     states_gdf = states_gdf.merge(electoral, on='state_po', how='left')
 
     states_gdf['id_strictness'] = states_gdf['id_strictness'].fillna(3)
     states_gdf['has_strict_id'] = (states_gdf['id_strictness'] <= 3).astype(int)
-    states_gdf['dem_won'] = (states_gdf['dem_share'] >= 50).astype(int)
 
     return states_gdf, year
 
@@ -825,22 +894,11 @@ def prepare_welfare_data(year=None):
     states_gdf = load_state_geodata()
     electoral, year = load_electoral_data(year)
 
-    policies = pd.read_csv(DATA_DIR / 'state_policies.csv')
-    if 'abbrev' in policies.columns:
-        policies = policies.rename(columns={'abbrev': 'state_po'})
-
-    policies['has_benefits'] = (
-        (policies['health_children'] == 1) |
-        (policies['health_adults'] == 1) |
-        (policies['health_seniors'] == 1) |
-        (policies['food'] == 1) |
-        (policies['eitc'] == 1)
-    ).astype(int)
+    policies = _load_policies()
 
     states_gdf = states_gdf.merge(policies[['state_po', 'has_benefits']], on='state_po', how='left')
     states_gdf = states_gdf.merge(electoral, on='state_po', how='left')
     states_gdf['has_benefits'] = states_gdf['has_benefits'].fillna(0).astype(int)
-    states_gdf['dem_won'] = (states_gdf['dem_share'] >= 50).astype(int)
 
     return states_gdf, year
 
@@ -853,7 +911,6 @@ def create_combined_four_panel_map(output_path=None, year=None):
     - Arrows between left and right maps on each row
     """
     set_style()
-    warnings.filterwarnings('ignore')
 
     # Load both datasets
     voter_id_gdf, year = prepare_voter_id_data(year)
@@ -861,9 +918,17 @@ def create_combined_four_panel_map(output_path=None, year=None):
 
     dem_candidate, rep_candidate = get_candidate_labels(year)
 
-    # Project to Albers
-    voter_id_gdf = voter_id_gdf.to_crs('ESRI:102003')
-    welfare_gdf = welfare_gdf.to_crs('ESRI:102003')
+    # Already Albers via load_state_geodata
+    voter_id_gdf = _ensure_albers(voter_id_gdf)
+    welfare_gdf = _ensure_albers(welfare_gdf)
+
+    # Color columns on the full frames before the splits (AK/HI inherit).
+    # Voter ID uses 2-tier colors: ID Required = light, No ID = dark;
+    # welfare is the inverse: Has Benefits = dark, No Benefits = light.
+    voter_id_gdf['color_indicator'] = np.where(voter_id_gdf['has_strict_id'] == 1, BLUE_LIGHT, BLUE_DARK)
+    voter_id_gdf['color_vote'] = np.where(voter_id_gdf['dem_won'] == 1, BLUE_VIVID, RED_VIVID)
+    welfare_gdf['color_indicator'] = np.where(welfare_gdf['has_benefits'] == 1, BLUE_DARK, BLUE_LIGHT)
+    welfare_gdf['color_vote'] = np.where(welfare_gdf['dem_won'] == 1, BLUE_VIVID, RED_VIVID)
 
     # Separate regions for voter ID
     vi_continental = voter_id_gdf[~voter_id_gdf['state_po'].isin(['AK', 'HI', 'PR', 'VI', 'GU', 'AS', 'MP'])].copy()
@@ -875,22 +940,6 @@ def create_combined_four_panel_map(output_path=None, year=None):
     wf_alaska = welfare_gdf[welfare_gdf['state_po'] == 'AK'].copy()
     wf_hawaii = welfare_gdf[welfare_gdf['state_po'] == 'HI'].copy()
 
-    # Create color columns for voter ID (2-tier colors: ID Required = light, No ID = dark)
-    vi_continental['color_indicator'] = vi_continental['has_strict_id'].map({1: BLUE_LIGHT, 0: BLUE_DARK})
-    vi_continental['color_vote'] = vi_continental['dem_won'].map({1: BLUE_VIVID, 0: RED_VIVID})
-    for region in [vi_alaska, vi_hawaii]:
-        if not region.empty:
-            region['color_indicator'] = region['has_strict_id'].map({1: BLUE_LIGHT, 0: BLUE_DARK})
-            region['color_vote'] = region['dem_won'].map({1: BLUE_VIVID, 0: RED_VIVID})
-
-    # Create color columns for welfare (2-tier colors: Has Benefits = dark, No Benefits = light)
-    wf_continental['color_indicator'] = wf_continental['has_benefits'].map({1: BLUE_DARK, 0: BLUE_LIGHT})
-    wf_continental['color_vote'] = wf_continental['dem_won'].map({1: BLUE_VIVID, 0: RED_VIVID})
-    for region in [wf_alaska, wf_hawaii]:
-        if not region.empty:
-            region['color_indicator'] = region['has_benefits'].map({1: BLUE_DARK, 0: BLUE_LIGHT})
-            region['color_vote'] = region['dem_won'].map({1: BLUE_VIVID, 0: RED_VIVID})
-
     # Count states
     n_id_req = int(voter_id_gdf['has_strict_id'].sum())
     n_no_id = len(voter_id_gdf) - n_id_req
@@ -964,7 +1013,9 @@ def create_combined_four_panel_map(output_path=None, year=None):
                  fontsize=18, fontweight='bold', y=0.97)
 
     if output_path:
-        fig.savefig(output_path, dpi=300, bbox_inches='tight', facecolor='white')
+        # Margins are managed explicitly by the GridSpec above, so the
+        # tight-bbox measuring pass (a full extra render) is skipped.
+        _save_png(fig, output_path, tight=False)
         plt.close(fig)
         print(f"  Saved: {output_path}")
 
@@ -982,39 +1033,24 @@ def create_standalone_alignment_map(
 ):
     """Create a standalone single-panel alignment map."""
     set_style()
-    warnings.filterwarnings('ignore')
 
     states_gdf = states_gdf.copy()
-    states_gdf = states_gdf.to_crs('ESRI:102003')
+    states_gdf = _ensure_albers(states_gdf)
+
+    # Calculate match on the full frame before the split (AK/HI inherit)
+    if invert_match:
+        states_gdf['match'] = (states_gdf[indicator_col] != states_gdf['dem_won']).astype(int)
+    else:
+        states_gdf['match'] = (states_gdf[indicator_col] == states_gdf['dem_won']).astype(int)
+    states_gdf['color_match'] = np.where(states_gdf['match'] == 1, GREEN_MATCH, ORANGE_MISMATCH)
 
     # Separate regions
     continental = states_gdf[~states_gdf['state_po'].isin(['AK', 'HI', 'PR', 'VI', 'GU', 'AS', 'MP'])].copy()
     alaska = states_gdf[states_gdf['state_po'] == 'AK'].copy()
     hawaii = states_gdf[states_gdf['state_po'] == 'HI'].copy()
 
-    # Calculate match
-    if invert_match:
-        continental['match'] = (continental[indicator_col] != continental['dem_won']).astype(int)
-    else:
-        continental['match'] = (continental[indicator_col] == continental['dem_won']).astype(int)
-    continental['color_match'] = continental['match'].map({1: GREEN_MATCH, 0: ORANGE_MISMATCH})
-
-    for region in [alaska, hawaii]:
-        if not region.empty:
-            if invert_match:
-                region['match'] = (region[indicator_col] != region['dem_won']).astype(int)
-            else:
-                region['match'] = (region[indicator_col] == region['dem_won']).astype(int)
-            region['color_match'] = region['match'].map({1: GREEN_MATCH, 0: ORANGE_MISMATCH})
-
-    # Calculate match from all states including AK/HI
-    all_matches = continental['match'].sum()
-    for region in [alaska, hawaii]:
-        if not region.empty and 'match' in region.columns:
-            all_matches += region['match'].sum()
-    n_match = int(all_matches)
-    total_states = len(continental) + (1 if not alaska.empty else 0) + (1 if not hawaii.empty else 0)
-    pct_match = 100 * n_match / total_states
+    n_match = int(states_gdf['match'].sum())
+    pct_match = 100 * n_match / len(states_gdf)
 
     # Create figure
     fig, ax = plt.subplots(figsize=(12, 8))
@@ -1031,7 +1067,7 @@ def create_standalone_alignment_map(
     plt.tight_layout()
 
     if output_path:
-        fig.savefig(output_path, dpi=300, bbox_inches='tight', facecolor='white')
+        _save_png(fig, output_path)
         plt.close(fig)
         print(f"  Saved: {output_path}")
 
@@ -1086,22 +1122,14 @@ def create_state_presidential_correlation(output_path=None):
 
     # Load data
     electoral, year = load_electoral_data(2024)
-    policies = pd.read_csv(DATA_DIR / 'state_policies.csv')
-    if 'abbrev' in policies.columns:
-        policies = policies.rename(columns={'abbrev': 'state_po'})
+    policies = _load_policies()
 
     # Merge
     df = electoral.merge(policies, on='state_po', how='left')
 
     # Create policy indicators
     df['has_strict_id'] = (df['id_strictness'] <= 3).astype(int)
-    df['has_benefits'] = (
-        (df['health_children'] == 1) |
-        (df['health_adults'] == 1) |
-        (df['health_seniors'] == 1) |
-        (df['food'] == 1) |
-        (df['eitc'] == 1)
-    ).astype(int)
+    df['has_benefits'] = _has_benefits(df)
 
     # Voter ID: compare ID-required vs no-ID states
     id_req = df[df['has_strict_id'] == 1]['dem_share']
@@ -1151,7 +1179,7 @@ def create_state_presidential_correlation(output_path=None):
     plt.tight_layout()
 
     if output_path:
-        fig.savefig(output_path, dpi=300, bbox_inches='tight', facecolor='white')
+        _save_png(fig, output_path)
         plt.close(fig)
         print(f"  Saved: {output_path}")
 
@@ -1179,22 +1207,14 @@ def create_state_house_correlation(output_path=None):
     house_2024 = house_2024.rename(columns={'state': 'state_po', 'dem_two_party_share': 'dem_share'})
 
     # Load policies
-    policies = pd.read_csv(DATA_DIR / 'state_policies.csv')
-    if 'abbrev' in policies.columns:
-        policies = policies.rename(columns={'abbrev': 'state_po'})
+    policies = _load_policies()
 
     # Merge
     df = house_2024.merge(policies, on='state_po', how='left')
 
     # Create policy indicators
     df['has_strict_id'] = (df['id_strictness'] <= 3).astype(int)
-    df['has_benefits'] = (
-        (df['health_children'] == 1) |
-        (df['health_adults'] == 1) |
-        (df['health_seniors'] == 1) |
-        (df['food'] == 1) |
-        (df['eitc'] == 1)
-    ).astype(int)
+    df['has_benefits'] = _has_benefits(df)
 
     # Voter ID: compare ID-required vs no-ID states
     id_req = df[df['has_strict_id'] == 1]['dem_share']
@@ -1240,7 +1260,7 @@ def create_state_house_correlation(output_path=None):
     plt.tight_layout()
 
     if output_path:
-        fig.savefig(output_path, dpi=300, bbox_inches='tight', facecolor='white')
+        _save_png(fig, output_path)
         plt.close(fig)
         print(f"  Saved: {output_path}")
 
@@ -1320,7 +1340,7 @@ def create_border_correlation(output_path=None):
     plt.tight_layout()
 
     if output_path:
-        fig.savefig(output_path, dpi=300, bbox_inches='tight', facecolor='white')
+        _save_png(fig, output_path)
         plt.close(fig)
         print(f"  Saved: {output_path}")
 
@@ -1366,7 +1386,7 @@ def create_border_correlation_welfare(output_path=None):
     plt.tight_layout()
 
     if output_path:
-        fig.savefig(output_path, dpi=300, bbox_inches='tight', facecolor='white')
+        _save_png(fig, output_path)
         plt.close(fig)
         print(f"  Saved: {output_path}")
 
@@ -1412,7 +1432,7 @@ def create_border_correlation_voter_id(output_path=None):
     plt.tight_layout()
 
     if output_path:
-        fig.savefig(output_path, dpi=300, bbox_inches='tight', facecolor='white')
+        _save_png(fig, output_path)
         plt.close(fig)
         print(f"  Saved: {output_path}")
 
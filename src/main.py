@@ -19,6 +19,13 @@ Outputs:
 import sys
 from pathlib import Path
 
+import matplotlib
+
+# The pipeline only writes files, so select the Agg backend up front:
+# skips GUI-toolkit probing at import time and works on headless machines.
+# Must run before anything imports matplotlib.pyplot.
+matplotlib.use('Agg')
+
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
@@ -39,11 +39,17 @@ def load_and_prepare(data_path: str = None) -> pd.DataFrame:
     # Tiers 1-3: ID verification required
     df['no_effective_id'] = (df['id_strictness'] >= 4).astype(int)
 
-    # Human-readable group labels (using 2-tier functional classification)
-    df['voter_id_policy'] = df['no_effective_id'].map({
-        1: 'No ID Required',
-        0: 'ID Required'
-    })
+    # Human-readable group labels (using 2-tier functional classification).
+    # Stored as a categorical: downstream code filters on this column
+    # repeatedly, and comparing integer category codes is cheaper than
+    # comparing strings row by row.
+    df['voter_id_policy'] = pd.Categorical(
+        df['no_effective_id'].map({
+            1: 'No ID Required',
+            0: 'ID Required'
+        }),
+        categories=['ID Required', 'No ID Required']
+    )
 
     return df
 